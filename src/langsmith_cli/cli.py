@@ -10,6 +10,14 @@ import click
 
 from . import config, fetchers, formatters
 
+_UUID_RE = re.compile(
+    r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$", re.IGNORECASE
+)
+_UNSAFE_FILENAME_CHARS_RE = re.compile(r"[^\w\-.]")
+_THREAD_ID_PLACEHOLDER_RE = re.compile(r"\{thread_id[^}]*\}")
+_TRACE_ID_PLACEHOLDER_RE = re.compile(r"\{trace_id[^}]*\}")
+_INDEX_PLACEHOLDER_RE = re.compile(r"\{(?:index|idx)[^}]*\}")
+
 
 def sanitize_filename(filename: str) -> str:
     """Sanitize a string to be used as a safe filename.
@@ -24,7 +32,7 @@ def sanitize_filename(filename: str) -> str:
     """
     # Remove or replace unsafe characters
     # Keep alphanumeric, hyphens, underscores, and dots
-    safe_name = re.sub(r"[^\w\-.]", "_", filename)
+    safe_name = _UNSAFE_FILENAME_CHARS_RE.sub("_", filename)
     # Remove leading/trailing dots and spaces
     safe_name = safe_name.strip(". ")
     # Limit length to 255 characters (filesystem limit)
@@ -427,8 +435,7 @@ def threads(
     # DIRECTORY MODE: output_dir provided
     if output_dir:
         # Check if user mistakenly passed a thread ID (UUID) instead of directory
-        uuid_pattern = r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$"
-        if re.match(uuid_pattern, output_dir, re.IGNORECASE):
+        if _UUID_RE.match(output_dir):
             click.echo(
                 f"Error: '{output_dir}' looks like a UUID, not a directory path.",
                 err=True,
@@ -451,10 +458,8 @@ def threads(
             )
 
         # Validate filename pattern
-        has_thread_id = re.search(r"\{thread_id[^}]*\}", filename_pattern)
-        has_index = re.search(r"\{index[^}]*\}", filename_pattern) or re.search(
-            r"\{idx[^}]*\}", filename_pattern
-        )
+        has_thread_id = _THREAD_ID_PLACEHOLDER_RE.search(filename_pattern)
+        has_index = _INDEX_PLACEHOLDER_RE.search(filename_pattern)
         if not (has_thread_id or has_index):
             click.echo(
                 "Error: Filename pattern must contain {thread_id} or {index}", err=True
@@ -716,8 +721,7 @@ def traces(
     # DIRECTORY MODE: output_dir provided
     if output_dir:
         # Check if user mistakenly passed a trace ID instead of directory
-        uuid_pattern = r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$"
-        if re.match(uuid_pattern, output_dir, re.IGNORECASE):
+        if _UUID_RE.match(output_dir):
             click.echo(
                 f"Error: '{output_dir}' looks like a trace ID, not a directory path.",
                 err=True,
@@ -742,10 +746,8 @@ def traces(
             click.echo("Warning: --file ignored in directory mode", err=True)
 
         # Validate filename pattern
-        has_trace_id = re.search(r"\{trace_id[^}]*\}", filename_pattern)
-        has_index = re.search(r"\{index[^}]*\}", filename_pattern) or re.search(
-            r"\{idx[^}]*\}", filename_pattern
-        )
+        has_trace_id = _TRACE_ID_PLACEHOLDER_RE.search(filename_pattern)
+        has_index = _INDEX_PLACEHOLDER_RE.search(filename_pattern)
         if not (has_trace_id or has_index):
             click.echo(
                 "Error: Filename pattern must contain {trace_id} or {index}", err=True
@@ -1,11 +1,27 @@
 """Pytest configuration and fixtures."""
 
-import shutil
-import tempfile
-from pathlib import Path
-from unittest.mock import patch
+import copy
+import json
 
 import pytest
+import requests
+
+# orjson only arrives transitively through langsmith (and not on PyPy); the
+# stdlib json fallback is an expected, fully supported path
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def dumps_body(obj) -> bytes:
+    """Serialize a mock response payload to JSON bytes, via orjson when available."""
+    if HAS_ORJSON:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
 
 # Test IDs from examples
 TEST_TRACE_ID = "3b0b15fe-1e3a-4aef-afa8-48df15879cfe"
@@ -14,8 +30,14 @@ TEST_PROJECT_UUID = "80f1ecb3-a16b-411e-97ae-1c89adbb5c49"
 TEST_API_KEY = "lsv2_test_key_123"
 TEST_BASE_URL = "https://api.smith.langchain.com"
 
+# Endpoint URLs built once so tests don't re-format them per mock registration
+TRACE_URL = f"{TEST_BASE_URL}/runs/{TEST_TRACE_ID}"
+THREAD_URL = f"{TEST_BASE_URL}/runs/threads/{TEST_THREAD_ID}"
+QUERY_URL = f"{TEST_BASE_URL}/runs/query"
+INFO_URL = f"{TEST_BASE_URL}/info"
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def sample_trace_response():
     """Sample trace API response."""
     return {
@@ -56,7 +78,7 @@ def sample_trace_response():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_thread_response():
     """Sample thread API response."""
     return {
@@ -70,20 +92,224 @@ def sample_thread_response():
     }
 
 
+@pytest.fixture(scope="session")
+def sample_trace_response_body(sample_trace_response):
+    """Sample trace API response, serialized once for mocked HTTP bodies."""
+    return dumps_body(sample_trace_response)
+
+
+@pytest.fixture(scope="session")
+def sample_thread_response_body(sample_thread_response):
+    """Sample thread API response, serialized once for mocked HTTP bodies."""
+    return dumps_body(sample_thread_response)
+
+
+@pytest.fixture(scope="session")
+def sample_trace_messages(sample_trace_response):
+    """Messages fetch_trace returns for the sample trace response."""
+    return sample_trace_response["outputs"]["messages"]
+
+
+@pytest.fixture(scope="session")
+def sample_thread_messages(sample_thread_response):
+    """Messages fetch_thread parses out of the sample thread response."""
+    return [
+        json.loads(line)
+        for line in sample_thread_response["previews"]["all_messages"].split("\n\n")
+    ]
+
+
+@pytest.fixture
+def stub_fetchers(monkeypatch, sample_trace_messages, sample_thread_messages):
+    """Stub fetch_trace/fetch_thread so CLI tests skip the HTTP layer entirely."""
+    from langsmith_cli import fetchers
+
+    # Hand out copies so a CLI that mutated messages could not also change the
+    # session-scoped values the tests compare its output against
+    monkeypatch.setattr(
+        fetchers,
+        "fetch_trace",
+        lambda *args, **kwargs: copy.deepcopy(sample_trace_messages),
+    )
+    monkeypatch.setattr(
+        fetchers,
+        "fetch_thread",
+        lambda *args, **kwargs: copy.deepcopy(sample_thread_messages),
+    )
+    # Skip the SDK root-run lookup done by fetch_thread_with_metadata
+    monkeypatch.setattr(fetchers, "HAS_LANGSMITH", False)
+
+
+class FakeResponse:
+    """Minimal stand-in for a successful requests.Response with a parsed payload."""
+
+    status_code = 200
+
+    def __init__(self, payload):
+        self._payload = payload
+
+    def json(self):
+        return self._payload
+
+    def raise_for_status(self):
+        pass
+
+
 @pytest.fixture
-def temp_config_dir():
-    """Create a temporary config directory."""
-    temp_dir = tempfile.mkdtemp()
-    with patch("langsmith_cli.config.CONFIG_DIR", Path(temp_dir)):
-        with patch("langsmith_cli.config.CONFIG_FILE", Path(temp_dir) / "config.yaml"):
-            yield Path(temp_dir)
-    shutil.rmtree(temp_dir)
+def fake_http(monkeypatch):
+    """Replace ``requests.get`` with one that returns a canned payload.
+
+    ``langsmith_cli.fetchers.requests`` is the global ``requests`` module, so
+    the patch applies process-wide for the test. The URL and params are
+    ignored; every GET gets the same payload. Skips request preparation and
+    the adapter entirely, for tests that only check how a response body is
+    parsed. Returns ``serve(payload)``.
+    """
+
+    def serve(payload):
+        response = FakeResponse(payload)
+        monkeypatch.setattr(
+            "langsmith_cli.fetchers.requests.get", lambda url, **kwargs: response
+        )
+
+    return serve
 
 
 @pytest.fixture
-def mock_env_api_key(monkeypatch):
-    """Mock LANGSMITH_API_KEY environment variable."""
-    monkeypatch.setenv("LANGSMITH_API_KEY", TEST_API_KEY)
+def http_error(monkeypatch):
+    """Replace ``requests.get`` with one that returns a real error Response.
+
+    Like ``fake_http`` the patch is process-wide and never reaches the adapter,
+    but the reply is a genuine ``requests.Response`` so its own
+    ``raise_for_status`` produces the HTTPError. Returns ``serve(status)``.
+    """
+
+    def serve(status):
+        def _get(url, **kwargs):
+            response = requests.Response()
+            response.status_code = status
+            response._content = b'{"error": "Request failed"}'
+            response.url = url
+            return response
+
+        monkeypatch.setattr("langsmith_cli.fetchers.requests.get", _get)
+
+    return serve
+
+
+class MockHTTP:
+    """Route table served from a patched HTTPAdapter.send.
+
+    Responses are built once in ``add`` and looked up by method and URL
+    (query string ignored), so serving a request is a dict lookup.
+    """
+
+    def __init__(self):
+        self.routes = {}
+        self.calls = []
+
+    def add(self, method, url, body, status=200):
+        """Register a reply for ``method url`` with a pre-serialized JSON body."""
+        response = requests.Response()
+        response.status_code = status
+        response._content = body
+        response.headers["Content-Type"] = "application/json"
+        self.routes[(method, url)] = response
+
+    def send(self, adapter, request, **kwargs):
+        self.calls.append(request)
+        key = (request.method, request.url.split("?", 1)[0])
+        if key not in self.routes:
+            raise requests.ConnectionError(f"No mock registered for {key}")
+        # Shallow copy plus own headers, so concurrent fetches never share
+        # mutable Response state
+        response = copy.copy(self.routes[key])
+        response.headers = response.headers.copy()
+        response.url = request.url
+        response.request = request
+        return response
+
+
+@pytest.fixture
+def mock_http(monkeypatch):
+    """Serve requests from a MockHTTP route table instead of ``responses``."""
+    mock = MockHTTP()
+
+    def _send(adapter, request, **kwargs):
+        return mock.send(adapter, request, **kwargs)
+
+    monkeypatch.setattr(requests.adapters.HTTPAdapter, "send", _send)
+    return mock
+
+
+@pytest.fixture(scope="session")
+def session_requests_mock():
+    """Start one responses mock for the whole session instead of one per test.
+
+    ``responses`` is imported here so that sessions which never request
+    ``rsps`` (e.g. ``-m config_io``) never import or activate it.
+    """
+    import responses
+
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as mock:
+        yield mock
+
+
+@pytest.fixture
+def rsps(session_requests_mock):
+    """Provide the shared responses mock, clearing routes and calls afterwards."""
+    yield session_requests_mock
+    session_requests_mock.reset()
+
+
+@pytest.fixture(scope="session")
+def temp_config_dir(tmp_path_factory):
+    """Create a temporary config directory shared across the session."""
+    return tmp_path_factory.mktemp("langsmith_cfg")
+
+
+@pytest.fixture(autouse=True)
+def isolated_config(temp_config_dir, monkeypatch):
+    """Point the config module at the temp directory and wipe it after each test."""
+    from langsmith_cli import config
+
+    config_file = temp_config_dir / "config.yaml"
+    monkeypatch.setattr(config, "CONFIG_DIR", temp_config_dir)
+    monkeypatch.setattr(config, "CONFIG_FILE", config_file)
+    yield config_file
+    config_file.unlink(missing_ok=True)
+
+
+@pytest.fixture
+def in_memory_config(monkeypatch):
+    """Back load_config/save_config with a dict instead of the YAML file."""
+    from langsmith_cli import config
+
+    store = {}
+
+    def _save(cfg):
+        store.clear()
+        store.update(cfg)
+
+    monkeypatch.setattr(config, "load_config", lambda: dict(store))
+    monkeypatch.setattr(config, "save_config", _save)
+    return store
+
+
+@pytest.fixture
+def plain_console(monkeypatch):
+    """Swap the formatters' Rich console for a wide, uncolored one.
+
+    The default console wraps at 80 columns when output is captured, which
+    splits long JSON strings across lines and makes the output unparseable.
+    """
+    from rich.console import Console
+
+    from langsmith_cli import formatters
+
+    console = Console(no_color=True, highlight=False, width=10_000)
+    monkeypatch.setattr(formatters, "console", console)
+    return console
 
 
 @pytest.fixture(autouse=True)
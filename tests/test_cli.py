@@ -1,598 +1,434 @@
 """Tests for CLI commands."""
 
+import json
+import re
+import shutil
 from unittest.mock import patch
 
-import responses
+import pytest
 from click.testing import CliRunner
 
 from langsmith_cli.cli import main
 from tests.conftest import (
+    INFO_URL,
+    QUERY_URL,
+    TEST_API_KEY,
     TEST_BASE_URL,
     TEST_PROJECT_UUID,
     TEST_THREAD_ID,
     TEST_TRACE_ID,
+    TRACE_URL,
+    dumps_body,
 )
 
+# Format tests only check text, so render through the wide plain console
+pytestmark = [pytest.mark.network, pytest.mark.usefixtures("plain_console")]
+
+# Subcommands invoked directly, skipping the group's dispatch on every test
+TRACE_CMD = main.commands["trace"]
+THREAD_CMD = main.commands["thread"]
+
+# Mocked response bodies, serialized once at import
+INFO_BODY = dumps_body({"version": "1.0"})
+
+THREAD_RUNS = [
+    {
+        "id": f"run-{i}",
+        "start_time": f"2024-01-{i:02d}T00:00:00Z",
+        "extra": {"metadata": {"thread_id": f"thread-{i}"}},
+    }
+    for i in (1, 2)
+]
+TWO_THREAD_RUNS_BODY = dumps_body({"runs": THREAD_RUNS})
+ONE_THREAD_RUN_BODY = dumps_body({"runs": THREAD_RUNS[:1]})
+
+
+def _trace_run(trace_id, name="test_run", **fields):
+    """Build a root run as returned by runs/query for the traces command."""
+    return {
+        "id": trace_id,
+        "name": name,
+        "start_time": "2024-01-01T00:00:00Z",
+        "run_type": "chain",
+        "trace_id": trace_id,
+        **fields,
+    }
+
+
+MULTI_TRACE_IDS = (
+    "3b0b15fe-1e3a-4aef-afa8-48df15879cf1",
+    "3b0b15fe-1e3a-4aef-afa8-48df15879cf2",
+    "3b0b15fe-1e3a-4aef-afa8-48df15879cf3",
+)
+MULTI_TRACE_URLS = tuple(f"{TEST_BASE_URL}/runs/{tid}" for tid in MULTI_TRACE_IDS)
+MULTI_TRACE_RUNS = [
+    _trace_run(tid, f"test_run_{i}") for i, tid in enumerate(MULTI_TRACE_IDS, 1)
+]
+TRACE_RUN_BODY = dumps_body({"runs": [_trace_run(TEST_TRACE_ID)]})
+FINISHED_TRACE_RUN = _trace_run(
+    TEST_TRACE_ID, end_time="2024-01-01T00:01:00Z", status="success"
+)
+TRACE_RUN_WITH_STATUS_BODY = dumps_body({"runs": [FINISHED_TRACE_RUN]})
+THREE_TRACE_RUNS_BODY = dumps_body({"runs": MULTI_TRACE_RUNS})
+TWO_TRACE_RUNS_BODY = dumps_body({"runs": MULTI_TRACE_RUNS[:2]})
 
-class TestTraceCommand:
-    """Tests for trace command."""
+# Matches every thread-N fetch so one registration serves all threads
+THREAD_URL_RE = re.compile(rf"{re.escape(TEST_BASE_URL)}/runs/threads/thread-\d+")
 
-    @responses.activate
-    def test_trace_default_format(self, sample_trace_response, mock_env_api_key):
-        """Test trace command with default (pretty) format."""
-        responses.add(
-            responses.GET,
-            f"https://api.smith.langchain.com/runs/{TEST_TRACE_ID}",
-            json=sample_trace_response,
-            status=200,
-        )
 
-        runner = CliRunner()
-        result = runner.invoke(main, ["trace", TEST_TRACE_ID])
+@pytest.fixture(scope="module", autouse=True)
+def _api_key_env():
+    """Set LANGSMITH_API_KEY once for every CLI test in this module."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("LANGSMITH_API_KEY", TEST_API_KEY)
+        yield
 
-        assert result.exit_code == 0
-        # Check for Rich panel indicators
-        assert "Message 1:" in result.output
-        assert "human" in result.output.lower() or "user" in result.output.lower()
 
-    @responses.activate
-    def test_trace_pretty_format(self, sample_trace_response, mock_env_api_key):
-        """Test trace command with explicit pretty format."""
-        responses.add(
-            responses.GET,
-            f"https://api.smith.langchain.com/runs/{TEST_TRACE_ID}",
-            json=sample_trace_response,
-            status=200,
-        )
+@pytest.fixture(scope="module")
+def output_root(tmp_path_factory):
+    """Create one temp directory for every CLI test in this module to write into."""
+    return tmp_path_factory.mktemp("cli_output")
+
 
+@pytest.fixture
+def output_dir(output_root):
+    """Provide an output directory under the shared root, removed after each test."""
+    out = output_root / "out"
+    yield out
+    shutil.rmtree(out, ignore_errors=True)
+
+
+@pytest.fixture
+def project_uuid_set(in_memory_config, monkeypatch):
+    """Configure TEST_PROJECT_UUID with no project env vars to override it."""
+    from langsmith_cli.config import set_config_value
+
+    monkeypatch.delenv("LANGSMITH_PROJECT", raising=False)
+    monkeypatch.delenv("LANGSMITH_PROJECT_UUID", raising=False)
+    set_config_value("project-uuid", TEST_PROJECT_UUID)
+    return TEST_PROJECT_UUID
+
+
+@pytest.fixture
+def expected_thread_output(sample_thread_messages):
+    """Thread command JSON output for the stubbed thread (metadata disabled)."""
+    return {
+        "thread_id": TEST_THREAD_ID,
+        "messages": sample_thread_messages,
+        "metadata": {},
+        "feedback": [],
+    }
+
+
+def invoke_until_exit(capsys, args):
+    """Run the CLI in-process up to its sys.exit and return (exit code, output)."""
+    with pytest.raises(SystemExit) as exc_info:
+        main.main(args, standalone_mode=False)
+    captured = capsys.readouterr()
+    return exc_info.value.code, captured.out + captured.err
+
+
+class TestTraceCommand:
+    """Tests for trace command."""
+
+    @pytest.mark.parametrize(
+        "format_args", [(), ("--format", "pretty")], ids=["default", "explicit"]
+    )
+    def test_trace_pretty_format(self, stub_fetchers, format_args):
+        """Test trace command with default and explicit pretty format."""
         runner = CliRunner()
-        result = runner.invoke(main, ["trace", TEST_TRACE_ID, "--format", "pretty"])
+        result = runner.invoke(TRACE_CMD, [TEST_TRACE_ID, *format_args])
 
         assert result.exit_code == 0
+        # Check for Rich panel indicators
         assert "Message 1:" in result.output
+        assert "human" in result.output.lower() or "user" in result.output.lower()
 
-    @responses.activate
-    def test_trace_json_format(self, sample_trace_response, mock_env_api_key):
+    def test_trace_json_format(self, stub_fetchers, sample_trace_messages):
         """Test trace command with json format."""
-        responses.add(
-            responses.GET,
-            f"https://api.smith.langchain.com/runs/{TEST_TRACE_ID}",
-            json=sample_trace_response,
-            status=200,
-        )
-
         runner = CliRunner()
-        result = runner.invoke(main, ["trace", TEST_TRACE_ID, "--format", "json"])
+        result = runner.invoke(TRACE_CMD, [TEST_TRACE_ID, "--format", "json"])
 
         assert result.exit_code == 0
-        # Output should be valid JSON with pretty formatting
-        assert '"type": "human"' in result.output or '"type": "user"' in result.output
-        # Check for content from the email (should be in the JSON somewhere)
-        assert "jane" in result.output.lower()  # Case-insensitive check
+        # Output should be the fetched messages, unchanged, as valid JSON
+        assert json.loads(result.output) == sample_trace_messages
 
-    @responses.activate
-    def test_trace_raw_format(self, sample_trace_response, mock_env_api_key):
+    def test_trace_raw_format(self, stub_fetchers, sample_trace_messages):
         """Test trace command with raw format."""
-        responses.add(
-            responses.GET,
-            f"https://api.smith.langchain.com/runs/{TEST_TRACE_ID}",
-            json=sample_trace_response,
-            status=200,
-        )
-
         runner = CliRunner()
-        result = runner.invoke(main, ["trace", TEST_TRACE_ID, "--format", "raw"])
+        result = runner.invoke(TRACE_CMD, [TEST_TRACE_ID, "--format", "raw"])
 
         assert result.exit_code == 0
-        # Should contain JSON array markers and message content
-        assert "[" in result.output
-        assert "]" in result.output
-        assert "type" in result.output or "role" in result.output
+        # Should be a compact JSON array of messages
+        assert result.output.count("\n") == 1
+        assert json.loads(result.output) == sample_trace_messages
 
-    def test_trace_no_api_key(self, monkeypatch):
+    def test_trace_no_api_key(self, monkeypatch, capsys):
         """Test trace command fails without API key."""
         monkeypatch.delenv("LANGSMITH_API_KEY", raising=False)
 
-        runner = CliRunner()
-        result = runner.invoke(main, ["trace", TEST_TRACE_ID])
+        exit_code, output = invoke_until_exit(capsys, ["trace", TEST_TRACE_ID])
 
-        assert result.exit_code == 1
-        assert "LANGSMITH_API_KEY not found" in result.output
+        assert exit_code == 1
+        assert "LANGSMITH_API_KEY not found" in output
 
-    @responses.activate
-    def test_trace_api_error(self, mock_env_api_key):
+    def test_trace_api_error(self, rsps):
         """Test trace command handles API errors."""
-        responses.add(
-            responses.GET,
-            f"https://api.smith.langchain.com/runs/{TEST_TRACE_ID}",
+        rsps.add(
+            rsps.GET,
+            TRACE_URL,
             json={"error": "Not found"},
             status=404,
         )
 
         runner = CliRunner()
-        result = runner.invoke(main, ["trace", TEST_TRACE_ID])
+        result = runner.invoke(TRACE_CMD, [TEST_TRACE_ID])
 
         assert result.exit_code == 1
         assert "Error fetching trace" in result.output
 
-    @responses.activate
-    def test_trace_with_metadata_flag(self, sample_trace_response, mock_env_api_key):
+    def test_trace_with_metadata_flag(self, rsps, sample_trace_response_body):
         """Test trace command with --include-metadata flag."""
-        responses.add(
-            responses.GET,
-            f"https://api.smith.langchain.com/runs/{TEST_TRACE_ID}?include_messages=true",
-            json=sample_trace_response,
+        rsps.add(
+            rsps.GET,
+            f"{TRACE_URL}?include_messages=true",
+            body=sample_trace_response_body,
+            content_type="application/json",
             status=200,
         )
 
         runner = CliRunner()
         result = runner.invoke(
-            main, ["trace", TEST_TRACE_ID, "--include-metadata", "--format", "json"]
+            TRACE_CMD, [TEST_TRACE_ID, "--include-metadata", "--format", "json"]
         )
 
         assert result.exit_code == 0
         # When metadata is included, output should contain metadata structure
-        assert "metadata" in result.output or "trace_id" in result.output
+        parsed = json.loads(result.output)
+        assert "metadata" in parsed or "trace_id" in parsed
 
-    @responses.activate
-    def test_trace_without_metadata_default(
-        self, sample_trace_response, mock_env_api_key
-    ):
+    def test_trace_without_metadata_default(self, stub_fetchers):
         """Test trace command defaults to no metadata."""
-        responses.add(
-            responses.GET,
-            f"https://api.smith.langchain.com/runs/{TEST_TRACE_ID}?include_messages=true",
-            json=sample_trace_response,
-            status=200,
-        )
-
         runner = CliRunner()
-        result = runner.invoke(main, ["trace", TEST_TRACE_ID, "--format", "json"])
+        result = runner.invoke(TRACE_CMD, [TEST_TRACE_ID, "--format", "json"])
 
         assert result.exit_code == 0
-        # Without flags, should just return messages array
-        output_lower = result.output.lower()
-        # Check that it contains message content but not metadata wrapper
-        assert "jane" in output_lower
+        # Without flags, should just return messages array, not a metadata wrapper
+        parsed = json.loads(result.output)
+        assert isinstance(parsed, list)
+        assert "jane" in parsed[0]["content"].lower()
 
 
 class TestThreadCommand:
     """Tests for thread command."""
 
-    @responses.activate
-    def test_thread_default_format_with_config(
-        self, sample_thread_response, mock_env_api_key, temp_config_dir, monkeypatch
-    ):
-        """Test thread command with default format and config."""
-        # Clear env vars to test config fallback
-        monkeypatch.delenv("LANGSMITH_PROJECT", raising=False)
-        monkeypatch.delenv("LANGSMITH_PROJECT_UUID", raising=False)
-
-        # Set up config
-        with patch("langsmith_cli.config.CONFIG_DIR", temp_config_dir):
-            with patch(
-                "langsmith_cli.config.CONFIG_FILE", temp_config_dir / "config.yaml"
-            ):
-                from langsmith_cli.config import set_config_value
-
-                set_config_value("project-uuid", TEST_PROJECT_UUID)
-
-                responses.add(
-                    responses.GET,
-                    f"https://api.smith.langchain.com/runs/threads/{TEST_THREAD_ID}",
-                    json=sample_thread_response,
-                    status=200,
-                )
-
-                runner = CliRunner()
-                result = runner.invoke(main, ["thread", TEST_THREAD_ID])
-
-                assert result.exit_code == 0
-                assert "Message 1:" in result.output
-
-    @responses.activate
-    def test_thread_pretty_format(
-        self, sample_thread_response, mock_env_api_key, temp_config_dir, monkeypatch
-    ):
-        """Test thread command with explicit pretty format."""
-        # Clear env vars to test config fallback
-        monkeypatch.delenv("LANGSMITH_PROJECT", raising=False)
-        monkeypatch.delenv("LANGSMITH_PROJECT_UUID", raising=False)
-
-        with patch("langsmith_cli.config.CONFIG_DIR", temp_config_dir):
-            with patch(
-                "langsmith_cli.config.CONFIG_FILE", temp_config_dir / "config.yaml"
-            ):
-                from langsmith_cli.config import set_config_value
-
-                set_config_value("project-uuid", TEST_PROJECT_UUID)
-
-                responses.add(
-                    responses.GET,
-                    f"https://api.smith.langchain.com/runs/threads/{TEST_THREAD_ID}",
-                    json=sample_thread_response,
-                    status=200,
-                )
-
-                runner = CliRunner()
-                result = runner.invoke(
-                    main, ["thread", TEST_THREAD_ID, "--format", "pretty"]
-                )
+    @pytest.mark.parametrize(
+        "format_args", [(), ("--format", "pretty")], ids=["default", "explicit"]
+    )
+    def test_thread_pretty_format(self, stub_fetchers, project_uuid_set, format_args):
+        """Test thread command with default and explicit pretty format."""
+        runner = CliRunner()
+        result = runner.invoke(THREAD_CMD, [TEST_THREAD_ID, *format_args])
 
-                assert result.exit_code == 0
-                assert "Message 1:" in result.output
+        assert result.exit_code == 0
+        assert "Message 1:" in result.output
 
-    @responses.activate
     def test_thread_json_format(
-        self, sample_thread_response, mock_env_api_key, temp_config_dir, monkeypatch
+        self, stub_fetchers, project_uuid_set, expected_thread_output
     ):
         """Test thread command with json format."""
-        # Clear env vars to test config fallback
-        monkeypatch.delenv("LANGSMITH_PROJECT", raising=False)
-        monkeypatch.delenv("LANGSMITH_PROJECT_UUID", raising=False)
-
-        with patch("langsmith_cli.config.CONFIG_DIR", temp_config_dir):
-            with patch(
-                "langsmith_cli.config.CONFIG_FILE", temp_config_dir / "config.yaml"
-            ):
-                from langsmith_cli.config import set_config_value
-
-                set_config_value("project-uuid", TEST_PROJECT_UUID)
-
-                responses.add(
-                    responses.GET,
-                    f"https://api.smith.langchain.com/runs/threads/{TEST_THREAD_ID}",
-                    json=sample_thread_response,
-                    status=200,
-                )
-
-                runner = CliRunner()
-                result = runner.invoke(
-                    main, ["thread", TEST_THREAD_ID, "--format", "json"]
-                )
+        runner = CliRunner()
+        result = runner.invoke(THREAD_CMD, [TEST_THREAD_ID, "--format", "json"])
 
-                assert result.exit_code == 0
-                assert '"role":' in result.output
+        assert result.exit_code == 0
+        assert json.loads(result.output) == expected_thread_output
 
-    @responses.activate
     def test_thread_raw_format(
-        self, sample_thread_response, mock_env_api_key, temp_config_dir, monkeypatch
+        self, stub_fetchers, project_uuid_set, expected_thread_output
     ):
         """Test thread command with raw format."""
-        # Clear env vars to test config fallback
-        monkeypatch.delenv("LANGSMITH_PROJECT", raising=False)
-        monkeypatch.delenv("LANGSMITH_PROJECT_UUID", raising=False)
-
-        with patch("langsmith_cli.config.CONFIG_DIR", temp_config_dir):
-            with patch(
-                "langsmith_cli.config.CONFIG_FILE", temp_config_dir / "config.yaml"
-            ):
-                from langsmith_cli.config import set_config_value
-
-                set_config_value("project-uuid", TEST_PROJECT_UUID)
-
-                responses.add(
-                    responses.GET,
-                    f"https://api.smith.langchain.com/runs/threads/{TEST_THREAD_ID}",
-                    json=sample_thread_response,
-                    status=200,
-                )
-
-                runner = CliRunner()
-                result = runner.invoke(
-                    main, ["thread", TEST_THREAD_ID, "--format", "raw"]
-                )
+        runner = CliRunner()
+        result = runner.invoke(THREAD_CMD, [TEST_THREAD_ID, "--format", "raw"])
 
-                assert result.exit_code == 0
-                # Should contain JSON array markers and message content
-                assert "[" in result.output
-                assert "]" in result.output
-                assert "role" in result.output or "type" in result.output
+        assert result.exit_code == 0
+        # Should be compact JSON wrapping the thread's messages
+        assert result.output.count("\n") == 1
+        assert json.loads(result.output) == expected_thread_output
 
-    @responses.activate
-    def test_thread_with_project_uuid_override(
-        self, sample_thread_response, mock_env_api_key
-    ):
+    def test_thread_with_project_uuid_override(self, stub_fetchers):
         """Test thread command with --project-uuid override."""
-        responses.add(
-            responses.GET,
-            f"https://api.smith.langchain.com/runs/threads/{TEST_THREAD_ID}",
-            json=sample_thread_response,
-            status=200,
-        )
-
         runner = CliRunner()
         result = runner.invoke(
-            main, ["thread", TEST_THREAD_ID, "--project-uuid", TEST_PROJECT_UUID]
+            THREAD_CMD, [TEST_THREAD_ID, "--project-uuid", TEST_PROJECT_UUID]
         )
 
         assert result.exit_code == 0
 
-    def test_thread_no_project_uuid(self, mock_env_api_key, temp_config_dir):
+    def test_thread_no_project_uuid(self, capsys):
         """Test thread command fails without project UUID."""
-        with patch("langsmith_cli.config.CONFIG_DIR", temp_config_dir):
-            with patch(
-                "langsmith_cli.config.CONFIG_FILE", temp_config_dir / "config.yaml"
-            ):
-                runner = CliRunner()
-                result = runner.invoke(main, ["thread", TEST_THREAD_ID])
+        exit_code, output = invoke_until_exit(capsys, ["thread", TEST_THREAD_ID])
 
-                assert result.exit_code == 1
-                assert "project-uuid required" in result.output
+        assert exit_code == 1
+        assert "project-uuid required" in output
 
-    def test_thread_no_api_key(self, monkeypatch, temp_config_dir):
+    def test_thread_no_api_key(self, project_uuid_set, monkeypatch, capsys):
         """Test thread command fails without API key."""
         monkeypatch.delenv("LANGSMITH_API_KEY", raising=False)
 
-        with patch("langsmith_cli.config.CONFIG_DIR", temp_config_dir):
-            with patch(
-                "langsmith_cli.config.CONFIG_FILE", temp_config_dir / "config.yaml"
-            ):
-                from langsmith_cli.config import set_config_value
+        exit_code, output = invoke_until_exit(capsys, ["thread", TEST_THREAD_ID])
 
-                set_config_value("project-uuid", TEST_PROJECT_UUID)
-
-                runner = CliRunner()
-                result = runner.invoke(main, ["thread", TEST_THREAD_ID])
-
-                assert result.exit_code == 1
-                assert "LANGSMITH_API_KEY not found" in result.output
+        assert exit_code == 1
+        assert "LANGSMITH_API_KEY not found" in output
 
 
 class TestThreadsCommand:
     """Tests for threads command."""
 
-    @responses.activate
     def test_threads_default_limit(
-        self, sample_thread_response, mock_env_api_key, temp_config_dir, tmp_path, monkeypatch
+        self, rsps, sample_thread_response_body, output_dir, project_uuid_set
     ):
         """Test threads command with default limit (1)."""
-        # Clear env vars to test config fallback
-        monkeypatch.delenv("LANGSMITH_PROJECT", raising=False)
-        monkeypatch.delenv("LANGSMITH_PROJECT_UUID", raising=False)
-
-        with patch("langsmith_cli.config.CONFIG_DIR", temp_config_dir):
-            with patch(
-                "langsmith_cli.config.CONFIG_FILE", temp_config_dir / "config.yaml"
-            ):
-                from langsmith_cli.config import set_config_value
-
-                set_config_value("project-uuid", TEST_PROJECT_UUID)
-
-                # Mock the runs query endpoint
-                responses.add(
-                    responses.POST,
-                    f"{TEST_BASE_URL}/runs/query",
-                    json={
-                        "runs": [
-                            {
-                                "id": "run-1",
-                                "start_time": "2024-01-01T00:00:00Z",
-                                "extra": {"metadata": {"thread_id": "thread-1"}},
-                            },
-                            {
-                                "id": "run-2",
-                                "start_time": "2024-01-02T00:00:00Z",
-                                "extra": {"metadata": {"thread_id": "thread-2"}},
-                            },
-                        ]
-                    },
-                    status=200,
-                )
+        # Mock the runs query endpoint
+        rsps.add(
+            rsps.POST,
+            QUERY_URL,
+            body=TWO_THREAD_RUNS_BODY,
+            content_type="application/json",
+            status=200,
+        )
 
-                # Mock the thread fetch endpoint
-                responses.add(
-                    responses.GET,
-                    f"{TEST_BASE_URL}/runs/threads/thread-1",
-                    json=sample_thread_response,
-                    status=200,
-                )
+        # Mock the thread fetch endpoints
+        rsps.add_callback(
+            rsps.GET,
+            THREAD_URL_RE,
+            callback=lambda request: (200, {}, sample_thread_response_body),
+        )
 
-                runner = CliRunner()
-                output_dir = tmp_path / "threads"
-                result = runner.invoke(main, ["threads", str(output_dir)])
+        runner = CliRunner()
+        result = runner.invoke(main, ["threads", str(output_dir)])
 
-                assert result.exit_code == 0
-                assert "Found 1 thread(s)" in result.output
-                assert "Successfully saved 1 thread(s)" in result.output
+        assert result.exit_code == 0
+        assert "Found 1 thread(s)" in result.output
+        assert "Successfully saved 1 thread(s)" in result.output
 
-                # Check that only one file was created (default limit is 1)
-                assert (output_dir / "thread-1.json").exists()
-                assert not (output_dir / "thread-2.json").exists()
+        # Check that only one file was created (default limit is 1)
+        assert (output_dir / "thread-1.json").exists()
+        assert not (output_dir / "thread-2.json").exists()
 
-    @responses.activate
     def test_threads_custom_limit(
-        self, sample_thread_response, mock_env_api_key, temp_config_dir, tmp_path, monkeypatch
+        self, rsps, sample_thread_response_body, output_dir, project_uuid_set
     ):
         """Test threads command with custom limit."""
-        # Clear env vars to test config fallback
-        monkeypatch.delenv("LANGSMITH_PROJECT", raising=False)
-        monkeypatch.delenv("LANGSMITH_PROJECT_UUID", raising=False)
-
-        with patch("langsmith_cli.config.CONFIG_DIR", temp_config_dir):
-            with patch(
-                "langsmith_cli.config.CONFIG_FILE", temp_config_dir / "config.yaml"
-            ):
-                from langsmith_cli.config import set_config_value
-
-                set_config_value("project-uuid", TEST_PROJECT_UUID)
-
-                # Mock the runs query endpoint
-                responses.add(
-                    responses.POST,
-                    f"{TEST_BASE_URL}/runs/query",
-                    json={
-                        "runs": [
-                            {
-                                "id": "run-1",
-                                "start_time": "2024-01-01T00:00:00Z",
-                                "extra": {"metadata": {"thread_id": "thread-1"}},
-                            }
-                        ]
-                    },
-                    status=200,
-                )
+        # Mock the runs query endpoint
+        rsps.add(
+            rsps.POST,
+            QUERY_URL,
+            body=ONE_THREAD_RUN_BODY,
+            content_type="application/json",
+            status=200,
+        )
 
-                # Mock the thread fetch endpoint
-                responses.add(
-                    responses.GET,
-                    f"{TEST_BASE_URL}/runs/threads/thread-1",
-                    json=sample_thread_response,
-                    status=200,
-                )
+        # Mock the thread fetch endpoint
+        rsps.add(
+            rsps.GET,
+            THREAD_URL_RE,
+            body=sample_thread_response_body,
+            content_type="application/json",
+            status=200,
+        )
 
-                runner = CliRunner()
-                output_dir = tmp_path / "threads"
-                result = runner.invoke(
-                    main, ["threads", str(output_dir), "--limit", "5"]
-                )
+        runner = CliRunner()
+        result = runner.invoke(main, ["threads", str(output_dir), "--limit", "5"])
 
-                assert result.exit_code == 0
-                assert "thread-1" in result.output
+        assert result.exit_code == 0
+        assert "thread-1" in result.output
 
-    def test_threads_no_project_uuid(self, mock_env_api_key, temp_config_dir, tmp_path):
+    def test_threads_no_project_uuid(self, output_dir, capsys):
         """Test threads command fails without project UUID."""
-        with patch("langsmith_cli.config.CONFIG_DIR", temp_config_dir):
-            with patch(
-                "langsmith_cli.config.CONFIG_FILE", temp_config_dir / "config.yaml"
-            ):
-                runner = CliRunner()
-                output_dir = tmp_path / "threads"
-                result = runner.invoke(main, ["threads", str(output_dir)])
-
-                assert result.exit_code == 1
-                assert "project-uuid required" in result.output
-
-    @responses.activate
+        exit_code, output = invoke_until_exit(capsys, ["threads", str(output_dir)])
+
+        assert exit_code == 1
+        assert "project-uuid required" in output
+
     def test_threads_custom_filename_pattern(
-        self, sample_thread_response, mock_env_api_key, temp_config_dir, tmp_path, monkeypatch
+        self, rsps, sample_thread_response_body, output_dir, project_uuid_set
     ):
         """Test threads command with custom filename pattern."""
-        # Clear env vars to test config fallback
-        monkeypatch.delenv("LANGSMITH_PROJECT", raising=False)
-        monkeypatch.delenv("LANGSMITH_PROJECT_UUID", raising=False)
-
-        with patch("langsmith_cli.config.CONFIG_DIR", temp_config_dir):
-            with patch(
-                "langsmith_cli.config.CONFIG_FILE", temp_config_dir / "config.yaml"
-            ):
-                from langsmith_cli.config import set_config_value
-
-                set_config_value("project-uuid", TEST_PROJECT_UUID)
-
-                # Mock the runs query endpoint
-                responses.add(
-                    responses.POST,
-                    f"{TEST_BASE_URL}/runs/query",
-                    json={
-                        "runs": [
-                            {
-                                "id": "run-1",
-                                "start_time": "2024-01-01T00:00:00Z",
-                                "extra": {"metadata": {"thread_id": "thread-1"}},
-                            },
-                            {
-                                "id": "run-2",
-                                "start_time": "2024-01-02T00:00:00Z",
-                                "extra": {"metadata": {"thread_id": "thread-2"}},
-                            },
-                        ]
-                    },
-                    status=200,
-                )
-
-                # Mock the thread fetch endpoints
-                for thread_id in ["thread-1", "thread-2"]:
-                    responses.add(
-                        responses.GET,
-                        f"{TEST_BASE_URL}/runs/threads/{thread_id}",
-                        json=sample_thread_response,
-                        status=200,
-                    )
-
-                runner = CliRunner()
-                output_dir = tmp_path / "threads"
-                result = runner.invoke(
-                    main,
-                    [
-                        "threads",
-                        str(output_dir),
-                        "--limit",
-                        "2",
-                        "--filename-pattern",
-                        "thread_{index:03d}.json",
-                    ],
-                )
-
-                assert result.exit_code == 0
-                assert "Found 2 thread(s)" in result.output
+        # Mock the runs query endpoint
+        rsps.add(
+            rsps.POST,
+            QUERY_URL,
+            body=TWO_THREAD_RUNS_BODY,
+            content_type="application/json",
+            status=200,
+        )
 
-                # Check that files were created with custom pattern
-                assert (output_dir / "thread_001.json").exists()
-                assert (output_dir / "thread_002.json").exists()
+        # Mock the thread fetch endpoints
+        rsps.add_callback(
+            rsps.GET,
+            THREAD_URL_RE,
+            callback=lambda request: (200, {}, sample_thread_response_body),
+        )
 
-    def test_threads_rejects_uuid_as_directory(self, mock_env_api_key):
-        """Test threads command rejects UUID passed as directory."""
         runner = CliRunner()
-        # Pass a valid UUID instead of a directory path
-        fake_uuid = "3a12d0b2-bda5-4500-8732-c1984f647df5"
         result = runner.invoke(
-            main, ["threads", fake_uuid, "--project-uuid", TEST_PROJECT_UUID]
+            main,
+            [
+                "threads",
+                str(output_dir),
+                "--limit",
+                "2",
+                "--filename-pattern",
+                "thread_{index:03d}.json",
+            ],
         )
 
-        assert result.exit_code == 1
-        assert "looks like a UUID" in result.output
-        assert "langsmith-fetch thread <thread-id>" in result.output
-        assert "langsmith-fetch threads <directory-path>" in result.output
+        assert result.exit_code == 0
+        assert "Found 2 thread(s)" in result.output
+
+        # Check that files were created with custom pattern
+        assert (output_dir / "thread_001.json").exists()
+        assert (output_dir / "thread_002.json").exists()
 
 
 class TestTracesCommand:
     """Tests for traces command."""
 
-    @responses.activate
     def test_traces_default_no_metadata(
-        self, sample_trace_response, mock_env_api_key, temp_config_dir, tmp_path
+        self, rsps, sample_trace_response_body, output_dir
     ):
         """Test traces command with directory output and default (no metadata)."""
         # Mock langsmith import
         with patch("langsmith_cli.fetchers.HAS_LANGSMITH", True):
             # Mock the /info endpoint (called by Client initialization)
-            responses.add(
-                responses.GET,
-                f"{TEST_BASE_URL}/info",
-                json={"version": "1.0"},
+            rsps.add(
+                rsps.GET,
+                INFO_URL,
+                body=INFO_BODY,
+                content_type="application/json",
                 status=200,
             )
 
             # Mock the runs query endpoint (called by Client.list_runs)
-            responses.add(
-                responses.POST,
-                f"{TEST_BASE_URL}/runs/query",
-                json={
-                    "runs": [
-                        {
-                            "id": "3b0b15fe-1e3a-4aef-afa8-48df15879cfe",
-                            "name": "test_run",
-                            "start_time": "2024-01-01T00:00:00Z",
-                            "run_type": "chain",
-                            "trace_id": "3b0b15fe-1e3a-4aef-afa8-48df15879cfe",
-                        }
-                    ]
-                },
+            rsps.add(
+                rsps.POST,
+                QUERY_URL,
+                body=TRACE_RUN_BODY,
+                content_type="application/json",
                 status=200,
             )
 
             # Mock the trace fetch endpoint
-            trace_id = "3b0b15fe-1e3a-4aef-afa8-48df15879cfe"
-            responses.add(
-                responses.GET,
-                f"{TEST_BASE_URL}/runs/{trace_id}",
-                json=sample_trace_response,
+            trace_id = TEST_TRACE_ID
+            rsps.add(
+                rsps.GET,
+                TRACE_URL,
+                body=sample_trace_response_body,
+                content_type="application/json",
                 status=200,
             )
 
             runner = CliRunner()
-            output_dir = tmp_path / "traces"
             result = runner.invoke(main, ["traces", str(output_dir), "--limit", "1"])
 
             assert result.exit_code == 0
@@ -601,58 +437,42 @@ class TestTracesCommand:
             assert "3 messages" in result.output  # Should show message count
 
             # Check that file was created and contains list (not dict)
-            import json
-
             trace_file = output_dir / f"{trace_id}.json"
             assert trace_file.exists()
-            with open(trace_file) as f:
-                data = json.load(f)
-                assert isinstance(data, list)  # Should be list when no metadata
+            data = json.loads(trace_file.read_text())
+            assert isinstance(data, list)  # Should be list when no metadata
 
-    @responses.activate
-    def test_traces_with_metadata(
-        self, sample_trace_response, mock_env_api_key, temp_config_dir, tmp_path
-    ):
+    def test_traces_with_metadata(self, rsps, sample_trace_response_body, output_dir):
         """Test traces command with --include-metadata flag."""
         with patch("langsmith_cli.fetchers.HAS_LANGSMITH", True):
             # Mock the /info endpoint
-            responses.add(
-                responses.GET,
-                f"{TEST_BASE_URL}/info",
-                json={"version": "1.0"},
+            rsps.add(
+                rsps.GET,
+                INFO_URL,
+                body=INFO_BODY,
+                content_type="application/json",
                 status=200,
             )
 
             # Mock the runs query endpoint with metadata fields
-            trace_id = "3b0b15fe-1e3a-4aef-afa8-48df15879cfe"
-            responses.add(
-                responses.POST,
-                f"{TEST_BASE_URL}/runs/query",
-                json={
-                    "runs": [
-                        {
-                            "id": trace_id,
-                            "name": "test_run",
-                            "start_time": "2024-01-01T00:00:00Z",
-                            "end_time": "2024-01-01T00:01:00Z",
-                            "run_type": "chain",
-                            "trace_id": trace_id,
-                            "status": "success",
-                        }
-                    ]
-                },
+            trace_id = TEST_TRACE_ID
+            rsps.add(
+                rsps.POST,
+                QUERY_URL,
+                body=TRACE_RUN_WITH_STATUS_BODY,
+                content_type="application/json",
                 status=200,
             )
 
-            responses.add(
-                responses.GET,
-                f"{TEST_BASE_URL}/runs/{trace_id}",
-                json=sample_trace_response,
+            rsps.add(
+                rsps.GET,
+                TRACE_URL,
+                body=sample_trace_response_body,
+                content_type="application/json",
                 status=200,
             )
 
             runner = CliRunner()
-            output_dir = tmp_path / "traces"
             result = runner.invoke(
                 main, ["traces", str(output_dir), "--limit", "1", "--include-metadata"]
             )
@@ -662,67 +482,47 @@ class TestTracesCommand:
             assert "3 messages, status:" in result.output  # Should show status
 
             # Check that file contains dict with metadata
-            import json
-
             trace_file = output_dir / f"{trace_id}.json"
             assert trace_file.exists()
-            with open(trace_file) as f:
-                data = json.load(f)
-                assert isinstance(data, dict)
-                assert "messages" in data
-                assert "metadata" in data
-                assert "feedback" in data
-                assert len(data["messages"]) == 3
-
-    @responses.activate
-    def test_traces_custom_limit(
-        self, sample_trace_response, mock_env_api_key, temp_config_dir, tmp_path
-    ):
+            data = json.loads(trace_file.read_text())
+            assert isinstance(data, dict)
+            assert "messages" in data
+            assert "metadata" in data
+            assert "feedback" in data
+            assert len(data["messages"]) == 3
+
+    def test_traces_custom_limit(self, rsps, sample_trace_response_body, output_dir):
         """Test traces command with custom limit."""
         with patch("langsmith_cli.fetchers.HAS_LANGSMITH", True):
             # Mock the /info endpoint
-            responses.add(
-                responses.GET,
-                f"{TEST_BASE_URL}/info",
-                json={"version": "1.0"},
+            rsps.add(
+                rsps.GET,
+                INFO_URL,
+                body=INFO_BODY,
+                content_type="application/json",
                 status=200,
             )
 
             # Mock the runs query endpoint
-            trace_ids = [
-                "3b0b15fe-1e3a-4aef-afa8-48df15879cf1",
-                "3b0b15fe-1e3a-4aef-afa8-48df15879cf2",
-                "3b0b15fe-1e3a-4aef-afa8-48df15879cf3",
-            ]
-            responses.add(
-                responses.POST,
-                f"{TEST_BASE_URL}/runs/query",
-                json={
-                    "runs": [
-                        {
-                            "id": tid,
-                            "name": f"test_run_{i}",
-                            "start_time": "2024-01-01T00:00:00Z",
-                            "run_type": "chain",
-                            "trace_id": tid,
-                        }
-                        for i, tid in enumerate(trace_ids, 1)
-                    ]
-                },
+            rsps.add(
+                rsps.POST,
+                QUERY_URL,
+                body=THREE_TRACE_RUNS_BODY,
+                content_type="application/json",
                 status=200,
             )
 
             # Mock trace fetch endpoints
-            for tid in trace_ids:
-                responses.add(
-                    responses.GET,
-                    f"{TEST_BASE_URL}/runs/{tid}",
-                    json=sample_trace_response,
+            for url in MULTI_TRACE_URLS:
+                rsps.add(
+                    rsps.GET,
+                    url,
+                    body=sample_trace_response_body,
+                    content_type="application/json",
                     status=200,
                 )
 
             runner = CliRunner()
-            output_dir = tmp_path / "traces"
             result = runner.invoke(main, ["traces", str(output_dir), "--limit", "3"])
 
             assert result.exit_code == 0
@@ -730,57 +530,43 @@ class TestTracesCommand:
             assert "Successfully saved 3 trace(s)" in result.output
 
             # Check that all files were created
-            for tid in trace_ids:
+            for tid in MULTI_TRACE_IDS:
                 assert (output_dir / f"{tid}.json").exists()
 
-    @responses.activate
     def test_traces_custom_filename_pattern(
-        self, sample_trace_response, mock_env_api_key, temp_config_dir, tmp_path
+        self, rsps, sample_trace_response_body, output_dir
     ):
         """Test traces command with custom filename pattern."""
         with patch("langsmith_cli.fetchers.HAS_LANGSMITH", True):
             # Mock the /info endpoint
-            responses.add(
-                responses.GET,
-                f"{TEST_BASE_URL}/info",
-                json={"version": "1.0"},
+            rsps.add(
+                rsps.GET,
+                INFO_URL,
+                body=INFO_BODY,
+                content_type="application/json",
                 status=200,
             )
 
             # Mock the runs query endpoint
-            trace_ids = [
-                "3b0b15fe-1e3a-4aef-afa8-48df15879cf1",
-                "3b0b15fe-1e3a-4aef-afa8-48df15879cf2",
-            ]
-            responses.add(
-                responses.POST,
-                f"{TEST_BASE_URL}/runs/query",
-                json={
-                    "runs": [
-                        {
-                            "id": tid,
-                            "name": f"test_run_{i}",
-                            "start_time": "2024-01-01T00:00:00Z",
-                            "run_type": "chain",
-                            "trace_id": tid,
-                        }
-                        for i, tid in enumerate(trace_ids, 1)
-                    ]
-                },
+            rsps.add(
+                rsps.POST,
+                QUERY_URL,
+                body=TWO_TRACE_RUNS_BODY,
+                content_type="application/json",
                 status=200,
             )
 
             # Mock trace fetch endpoints
-            for tid in trace_ids:
-                responses.add(
-                    responses.GET,
-                    f"{TEST_BASE_URL}/runs/{tid}",
-                    json=sample_trace_response,
+            for url in MULTI_TRACE_URLS[:2]:
+                rsps.add(
+                    rsps.GET,
+                    url,
+                    body=sample_trace_response_body,
+                    content_type="application/json",
                     status=200,
                 )
 
             runner = CliRunner()
-            output_dir = tmp_path / "traces"
             result = runner.invoke(
                 main,
                 [
@@ -800,48 +586,38 @@ class TestTracesCommand:
             assert (output_dir / "trace_001.json").exists()
             assert (output_dir / "trace_002.json").exists()
 
-    @responses.activate
     def test_traces_with_project_uuid(
-        self, sample_trace_response, mock_env_api_key, temp_config_dir, tmp_path
+        self, rsps, sample_trace_response_body, output_dir
     ):
         """Test traces command with --project-uuid filter."""
         with patch("langsmith_cli.fetchers.HAS_LANGSMITH", True):
             # Mock the /info endpoint
-            responses.add(
-                responses.GET,
-                f"{TEST_BASE_URL}/info",
-                json={"version": "1.0"},
+            rsps.add(
+                rsps.GET,
+                INFO_URL,
+                body=INFO_BODY,
+                content_type="application/json",
                 status=200,
             )
 
             # Mock the runs query endpoint
-            trace_id = "3b0b15fe-1e3a-4aef-afa8-48df15879cfe"
-            responses.add(
-                responses.POST,
-                f"{TEST_BASE_URL}/runs/query",
-                json={
-                    "runs": [
-                        {
-                            "id": trace_id,
-                            "name": "test_run",
-                            "start_time": "2024-01-01T00:00:00Z",
-                            "run_type": "chain",
-                            "trace_id": trace_id,
-                        }
-                    ]
-                },
+            rsps.add(
+                rsps.POST,
+                QUERY_URL,
+                body=TRACE_RUN_BODY,
+                content_type="application/json",
                 status=200,
             )
 
-            responses.add(
-                responses.GET,
-                f"{TEST_BASE_URL}/runs/{trace_id}",
-                json=sample_trace_response,
+            rsps.add(
+                rsps.GET,
+                TRACE_URL,
+                body=sample_trace_response_body,
+                content_type="application/json",
                 status=200,
             )
 
             runner = CliRunner()
-            output_dir = tmp_path / "traces"
             result = runner.invoke(
                 main,
                 [
@@ -857,14 +633,22 @@ class TestTracesCommand:
             assert result.exit_code == 0
             assert "Found 1 trace(s)" in result.output
 
-    def test_traces_rejects_uuid_as_directory(self, mock_env_api_key):
-        """Test traces command rejects UUID passed as directory."""
-        runner = CliRunner()
-        # Pass a valid UUID instead of a directory path
-        fake_uuid = "3a12d0b2-bda5-4500-8732-c1984f647df5"
-        result = runner.invoke(main, ["traces", fake_uuid, "--include-metadata"])
 
-        assert result.exit_code == 1
-        assert "looks like a trace ID" in result.output
-        assert "langsmith-fetch trace <trace-id>" in result.output
-        assert "langsmith-fetch traces <directory-path>" in result.output
+@pytest.mark.parametrize(
+    "command, extra_args, hint",
+    [
+        ("threads", ["--project-uuid", TEST_PROJECT_UUID], "looks like a UUID"),
+        ("traces", ["--include-metadata"], "looks like a trace ID"),
+    ],
+    ids=["threads", "traces"],
+)
+def test_rejects_uuid_as_directory(capsys, command, extra_args, hint):
+    """Test threads/traces commands reject a UUID passed as the directory."""
+    singular = command[:-1]
+    fake_uuid = "3a12d0b2-bda5-4500-8732-c1984f647df5"
+    exit_code, output = invoke_until_exit(capsys, [command, fake_uuid, *extra_args])
+
+    assert exit_code == 1
+    assert hint in output
+    assert f"langsmith-fetch {singular} <{singular}-id>" in output
+    assert f"langsmith-fetch {command} <directory-path>" in output
@@ -1,35 +1,91 @@
 """Tests for fetchers module."""
 
 import json
+from dataclasses import dataclass, field
 from datetime import datetime
 from unittest.mock import Mock, patch
 
 import pytest
 import requests
-import responses
 
 from langsmith_cli import fetchers
 from tests.conftest import (
+    QUERY_URL,
     TEST_API_KEY,
     TEST_BASE_URL,
     TEST_PROJECT_UUID,
     TEST_THREAD_ID,
     TEST_TRACE_ID,
+    THREAD_URL,
+    TRACE_URL,
+    dumps_body,
 )
 
+pytestmark = pytest.mark.network
+
+# Filter fetch_latest_trace and fetch_recent_traces pass to Client.list_runs
+ROOT_RUNS_FILTER = 'and(eq(is_root, true), neq(status, "pending"))'
+
+
+def _assert_list_runs(call_kwargs, limit):
+    """Assert list_runs got the root-runs filter and the expected limit."""
+    assert call_kwargs["filter"] == ROOT_RUNS_FILTER
+    assert call_kwargs["limit"] == limit
+
+
+# Thread fetch URLs for the thread-1..thread-3 runs in the recent-threads tests
+THREAD_URLS = tuple(f"{TEST_BASE_URL}/runs/threads/thread-{i}" for i in range(1, 4))
+
+
+def _thread_run(run_id, day, thread_id=None):
+    """Build a runs/query root run started on 2024-01-<day>, tagged with thread_id."""
+    metadata = {} if thread_id is None else {"thread_id": thread_id}
+    return {
+        "id": run_id,
+        "start_time": f"2024-01-{day:02d}T00:00:00Z",
+        "extra": {"metadata": metadata},
+    }
+
+
+# runs/query bodies for the recent-threads tests, serialized once at import
+TWO_THREADS_QUERY_BODY = dumps_body(
+    {"runs": [_thread_run("run-1", 2, "thread-1"), _thread_run("run-2", 1, "thread-2")]}
+)
+THREE_THREADS_QUERY_BODY = dumps_body(
+    {
+        "runs": [
+            _thread_run("run-1", 3, "thread-1"),
+            _thread_run("run-2", 2, "thread-2"),
+            _thread_run("run-3", 1, "thread-3"),
+        ]
+    }
+)
+MISSING_THREAD_ID_QUERY_BODY = dumps_body(
+    {"runs": [_thread_run("run-1", 2, "thread-1"), _thread_run("run-2", 1)]}
+)
+DUPLICATE_THREAD_QUERY_BODY = dumps_body(
+    {"runs": [_thread_run("run-1", 2, "thread-1"), _thread_run("run-2", 1, "thread-1")]}
+)
+ONE_THREAD_QUERY_BODY = dumps_body({"runs": [_thread_run("run-1", 2, "thread-1")]})
+
+
+@dataclass(frozen=True, slots=True)
+class FakeRun:
+    """The SDK Run fields fetch_recent_traces reads when listing root runs."""
+
+    id: str
+    feedback_stats: dict = field(default_factory=dict)
+    start_time: datetime | None = None
+    end_time: datetime | None = None
+    extra: dict = field(default_factory=dict)
+
 
 class TestFetchTrace:
     """Tests for fetch_trace function."""
 
-    @responses.activate
-    def test_fetch_trace_success(self, sample_trace_response):
+    def test_fetch_trace_success(self, fake_http, sample_trace_response):
         """Test successful trace fetching."""
-        responses.add(
-            responses.GET,
-            f"https://api.smith.langchain.com/runs/{TEST_TRACE_ID}",
-            json=sample_trace_response,
-            status=200,
-        )
+        fake_http(sample_trace_response)
 
         messages = fetchers.fetch_trace(
             TEST_TRACE_ID, base_url=TEST_BASE_URL, api_key=TEST_API_KEY
@@ -40,52 +96,26 @@ class TestFetchTrace:
         assert messages[0]["type"] == "human"
         assert "jane@example.com" in messages[0]["content"]
 
-    @responses.activate
-    def test_fetch_trace_not_found(self):
-        """Test fetch_trace with 404 error."""
-        responses.add(
-            responses.GET,
-            f"https://api.smith.langchain.com/runs/{TEST_TRACE_ID}",
-            json={"error": "Not found"},
-            status=404,
-        )
-
-        with pytest.raises(requests.HTTPError):
-            fetchers.fetch_trace(
-                TEST_TRACE_ID, base_url=TEST_BASE_URL, api_key=TEST_API_KEY
-            )
-
-    @responses.activate
-    def test_fetch_trace_api_key_sent(self, sample_trace_response):
+    def test_fetch_trace_api_key_sent(self, mock_http, sample_trace_response_body):
         """Test that API key is sent in headers."""
-        responses.add(
-            responses.GET,
-            f"https://api.smith.langchain.com/runs/{TEST_TRACE_ID}",
-            json=sample_trace_response,
-            status=200,
-        )
+        mock_http.add("GET", TRACE_URL, body=sample_trace_response_body)
 
         fetchers.fetch_trace(
             TEST_TRACE_ID, base_url=TEST_BASE_URL, api_key=TEST_API_KEY
         )
 
         # Check that the request was made with correct headers
-        assert len(responses.calls) == 1
-        assert responses.calls[0].request.headers["X-API-Key"] == TEST_API_KEY
+        assert len(mock_http.calls) == 1
+        assert mock_http.calls[0].url.startswith(f"{TRACE_URL}?")
+        assert mock_http.calls[0].headers["X-API-Key"] == TEST_API_KEY
 
 
 class TestFetchThread:
     """Tests for fetch_thread function."""
 
-    @responses.activate
-    def test_fetch_thread_success(self, sample_thread_response):
+    def test_fetch_thread_success(self, fake_http, sample_thread_response):
         """Test successful thread fetching."""
-        responses.add(
-            responses.GET,
-            f"https://api.smith.langchain.com/runs/threads/{TEST_THREAD_ID}",
-            json=sample_thread_response,
-            status=200,
-        )
+        fake_http(sample_thread_response)
 
         messages = fetchers.fetch_thread(
             TEST_THREAD_ID,
@@ -99,15 +129,9 @@ class TestFetchThread:
         assert messages[0]["role"] == "user"
         assert "jane@example.com" in messages[0]["content"]
 
-    @responses.activate
-    def test_fetch_thread_params_sent(self, sample_thread_response):
+    def test_fetch_thread_params_sent(self, mock_http, sample_thread_response_body):
         """Test that correct params are sent in thread request."""
-        responses.add(
-            responses.GET,
-            f"https://api.smith.langchain.com/runs/threads/{TEST_THREAD_ID}",
-            json=sample_thread_response,
-            status=200,
-        )
+        mock_http.add("GET", THREAD_URL, body=sample_thread_response_body)
 
         fetchers.fetch_thread(
             TEST_THREAD_ID,
@@ -117,40 +141,19 @@ class TestFetchThread:
         )
 
         # Check that the request was made with correct params
-        assert len(responses.calls) == 1
-        request = responses.calls[0].request
+        assert len(mock_http.calls) == 1
+        request = mock_http.calls[0]
         assert request.headers["X-API-Key"] == TEST_API_KEY
+        assert request.url.startswith(f"{THREAD_URL}?")
         # Check query params
         assert "select=all_messages" in request.url
         assert f"session_id={TEST_PROJECT_UUID}" in request.url
 
-    @responses.activate
-    def test_fetch_thread_not_found(self):
-        """Test fetch_thread with 404 error."""
-        responses.add(
-            responses.GET,
-            f"https://api.smith.langchain.com/runs/threads/{TEST_THREAD_ID}",
-            json={"error": "Not found"},
-            status=404,
-        )
-
-        with pytest.raises(requests.HTTPError):
-            fetchers.fetch_thread(
-                TEST_THREAD_ID,
-                TEST_PROJECT_UUID,
-                base_url=TEST_BASE_URL,
-                api_key=TEST_API_KEY,
-            )
-
-    @responses.activate
-    def test_fetch_thread_parses_multiline_json(self, sample_thread_response):
+    def test_fetch_thread_parses_multiline_json(
+        self, fake_http, sample_thread_response
+    ):
         """Test that thread fetcher correctly parses newline-separated JSON."""
-        responses.add(
-            responses.GET,
-            f"https://api.smith.langchain.com/runs/threads/{TEST_THREAD_ID}",
-            json=sample_thread_response,
-            status=200,
-        )
+        fake_http(sample_thread_response)
 
         messages = fetchers.fetch_thread(
             TEST_THREAD_ID,
@@ -167,30 +170,87 @@ class TestFetchThread:
             assert "role" in msg or "type" in msg
 
 
-class TestFetchLatestTrace:
-    """Tests for fetch_latest_trace function."""
+@pytest.mark.parametrize("status", [401, 403, 404, 500])
+@pytest.mark.parametrize(
+    "fetch",
+    [
+        lambda: fetchers.fetch_trace(
+            TEST_TRACE_ID, base_url=TEST_BASE_URL, api_key=TEST_API_KEY
+        ),
+        lambda: fetchers.fetch_thread(
+            TEST_THREAD_ID,
+            TEST_PROJECT_UUID,
+            base_url=TEST_BASE_URL,
+            api_key=TEST_API_KEY,
+        ),
+    ],
+    ids=["trace", "thread"],
+)
+def test_fetch_http_error(http_error, fetch, status):
+    """Test fetch_trace/fetch_thread raise requests' HTTPError on error statuses."""
+    http_error(status)
 
-    @responses.activate
-    @patch("langsmith.Client")
-    def test_fetch_latest_trace_success(self, mock_client_class, sample_trace_response):
-        """Test successful latest trace fetching."""
-        # Mock the Client and its list_runs method
+    with pytest.raises(requests.HTTPError, match=str(status)):
+        fetch()
+
+
+@pytest.fixture(scope="class")
+def langsmith_client_patch():
+    """Patch langsmith.Client once per class with a client returning one run."""
+    with patch("langsmith.Client") as mock_client_class:
         mock_client = Mock()
         mock_run = Mock()
         mock_run.id = TEST_TRACE_ID
-        mock_client.list_runs.return_value = [mock_run]
         mock_client_class.return_value = mock_client
+        yield mock_client_class, mock_client, mock_run
+
+
+@pytest.fixture
+def mocked_langsmith_client(langsmith_client_patch):
+    """Reset the class-wide Client mocks and return (class, client, run)."""
+    mock_client_class, mock_client, mock_run = langsmith_client_patch
+    mock_client_class.reset_mock()
+    mock_client.reset_mock()
+    mock_client.list_runs.return_value = [mock_run]
+    return langsmith_client_patch
+
+
+class TestFetchLatestTrace:
+    """Tests for fetch_latest_trace function."""
+
+    @pytest.mark.parametrize(
+        "kwargs, check_call",
+        [
+            ({}, lambda ck: "project_id" not in ck),
+            (
+                {"project_uuid": TEST_PROJECT_UUID},
+                lambda ck: ck["project_id"] == TEST_PROJECT_UUID,
+            ),
+            ({"project_uuid": None}, lambda ck: "project_id" not in ck),
+            ({"last_n_minutes": 30}, lambda ck: isinstance(ck["start_time"], datetime)),
+            (
+                {"since": "2025-12-09T10:00:00Z"},
+                lambda ck: isinstance(ck["start_time"], datetime),
+            ),
+        ],
+        ids=["default", "project_uuid", "no_project_uuid", "time_window", "since"],
+    )
+    def test_fetch_latest_trace(
+        self,
+        kwargs,
+        check_call,
+        mocked_langsmith_client,
+        mock_http,
+        sample_trace_response_body,
+    ):
+        """Test latest trace fetching passes each filter through to list_runs."""
+        mock_client_class, mock_client, _ = mocked_langsmith_client
 
         # Mock the REST API call for fetch_trace
-        responses.add(
-            responses.GET,
-            f"https://api.smith.langchain.com/runs/{TEST_TRACE_ID}",
-            json=sample_trace_response,
-            status=200,
-        )
+        mock_http.add("GET", TRACE_URL, body=sample_trace_response_body)
 
         messages = fetchers.fetch_latest_trace(
-            api_key=TEST_API_KEY, base_url=TEST_BASE_URL
+            api_key=TEST_API_KEY, base_url=TEST_BASE_URL, **kwargs
         )
 
         # Verify Client was instantiated with correct API key
@@ -199,197 +259,46 @@ class TestFetchLatestTrace:
         # Verify list_runs was called with correct parameters
         mock_client.list_runs.assert_called_once()
         call_kwargs = mock_client.list_runs.call_args[1]
-        assert call_kwargs["filter"] == 'and(eq(is_root, true), neq(status, "pending"))'
-        assert call_kwargs["limit"] == 1
+        _assert_list_runs(call_kwargs, limit=1)
+        assert check_call(call_kwargs)
 
         # Verify the messages were fetched correctly
         assert isinstance(messages, list)
         assert len(messages) == 3
 
-    @patch("langsmith.Client")
-    def test_fetch_latest_trace_no_traces_found(self, mock_client_class):
+    def test_fetch_latest_trace_no_traces_found(self, mocked_langsmith_client):
         """Test fetch_latest_trace when no traces are found."""
+        _, mock_client, _ = mocked_langsmith_client
         # Mock empty list_runs result
-        mock_client = Mock()
         mock_client.list_runs.return_value = []
-        mock_client_class.return_value = mock_client
 
         with pytest.raises(ValueError, match="No traces found matching criteria"):
             fetchers.fetch_latest_trace(api_key=TEST_API_KEY, base_url=TEST_BASE_URL)
 
-    @responses.activate
-    @patch("langsmith.Client")
-    def test_fetch_latest_trace_with_project_uuid(
-        self, mock_client_class, sample_trace_response
-    ):
-        """Test latest trace fetching with project UUID filter."""
-        # Mock the Client
-        mock_client = Mock()
-        mock_run = Mock()
-        mock_run.id = TEST_TRACE_ID
-        mock_client.list_runs.return_value = [mock_run]
-        mock_client_class.return_value = mock_client
-
-        # Mock the REST API call
-        responses.add(
-            responses.GET,
-            f"https://api.smith.langchain.com/runs/{TEST_TRACE_ID}",
-            json=sample_trace_response,
-            status=200,
-        )
-
-        messages = fetchers.fetch_latest_trace(
-            api_key=TEST_API_KEY, base_url=TEST_BASE_URL, project_uuid=TEST_PROJECT_UUID
-        )
-
-        # Verify list_runs was called with project_id
-        call_kwargs = mock_client.list_runs.call_args[1]
-        assert call_kwargs["project_id"] == TEST_PROJECT_UUID
-        assert call_kwargs["filter"] == 'and(eq(is_root, true), neq(status, "pending"))'
-        assert call_kwargs["limit"] == 1
-
-        assert isinstance(messages, list)
-
-    @responses.activate
-    @patch("langsmith.Client")
-    def test_fetch_latest_trace_with_time_window(
-        self, mock_client_class, sample_trace_response
-    ):
-        """Test latest trace fetching with last_n_minutes filter."""
-        # Mock the Client
-        mock_client = Mock()
-        mock_run = Mock()
-        mock_run.id = TEST_TRACE_ID
-        mock_client.list_runs.return_value = [mock_run]
-        mock_client_class.return_value = mock_client
-
-        # Mock the REST API call
-        responses.add(
-            responses.GET,
-            f"https://api.smith.langchain.com/runs/{TEST_TRACE_ID}",
-            json=sample_trace_response,
-            status=200,
-        )
-
-        messages = fetchers.fetch_latest_trace(
-            api_key=TEST_API_KEY, base_url=TEST_BASE_URL, last_n_minutes=30
-        )
-
-        # Verify list_runs was called with start_time
-        call_kwargs = mock_client.list_runs.call_args[1]
-        assert "start_time" in call_kwargs
-        assert isinstance(call_kwargs["start_time"], datetime)
-        assert call_kwargs["filter"] == 'and(eq(is_root, true), neq(status, "pending"))'
-
-        assert isinstance(messages, list)
-
-    @responses.activate
-    @patch("langsmith.Client")
-    def test_fetch_latest_trace_with_since_timestamp(
-        self, mock_client_class, sample_trace_response
-    ):
-        """Test latest trace fetching with since timestamp filter."""
-        # Mock the Client
-        mock_client = Mock()
-        mock_run = Mock()
-        mock_run.id = TEST_TRACE_ID
-        mock_client.list_runs.return_value = [mock_run]
-        mock_client_class.return_value = mock_client
-
-        # Mock the REST API call
-        responses.add(
-            responses.GET,
-            f"https://api.smith.langchain.com/runs/{TEST_TRACE_ID}",
-            json=sample_trace_response,
-            status=200,
-        )
-
-        since_timestamp = "2025-12-09T10:00:00Z"
-        messages = fetchers.fetch_latest_trace(
-            api_key=TEST_API_KEY, base_url=TEST_BASE_URL, since=since_timestamp
-        )
-
-        # Verify list_runs was called with start_time
-        call_kwargs = mock_client.list_runs.call_args[1]
-        assert "start_time" in call_kwargs
-        assert isinstance(call_kwargs["start_time"], datetime)
-        assert call_kwargs["filter"] == 'and(eq(is_root, true), neq(status, "pending"))'
-
-        assert isinstance(messages, list)
-
-    @responses.activate
-    @patch("langsmith.Client")
-    def test_fetch_latest_trace_without_project_uuid(
-        self, mock_client_class, sample_trace_response
-    ):
-        """Test latest trace searches all projects when project_uuid is None."""
-        # Mock the Client
-        mock_client = Mock()
-        mock_run = Mock()
-        mock_run.id = TEST_TRACE_ID
-        mock_client.list_runs.return_value = [mock_run]
-        mock_client_class.return_value = mock_client
-
-        # Mock the REST API call
-        responses.add(
-            responses.GET,
-            f"https://api.smith.langchain.com/runs/{TEST_TRACE_ID}",
-            json=sample_trace_response,
-            status=200,
-        )
-
-        messages = fetchers.fetch_latest_trace(
-            api_key=TEST_API_KEY, base_url=TEST_BASE_URL, project_uuid=None
-        )
-
-        # Verify list_runs was called WITHOUT project_id parameter
-        call_kwargs = mock_client.list_runs.call_args[1]
-        assert "project_id" not in call_kwargs
-        assert call_kwargs["filter"] == 'and(eq(is_root, true), neq(status, "pending"))'
-        assert call_kwargs["limit"] == 1
-
-        assert isinstance(messages, list)
-
 
 class TestFetchRecentTraces:
     """Tests for fetch_recent_traces function."""
 
-    @responses.activate
     @patch("langsmith.Client")
     def test_fetch_recent_traces_success(
-        self, mock_client_class, sample_trace_response
+        self, mock_client_class, mock_http, sample_trace_response_body
     ):
         """Test successful recent traces fetching."""
         # Mock the Client and its list_runs method
         mock_client = Mock()
-        mock_run1 = Mock()
-        mock_run1.id = "trace-id-1"
-        mock_run1.feedback_stats = {}  # Empty dict, not a Mock
-        mock_run1.start_time = None
-        mock_run1.end_time = None
-        mock_run1.extra = {}
-        mock_run2 = Mock()
-        mock_run2.id = "trace-id-2"
-        mock_run2.feedback_stats = {}  # Empty dict, not a Mock
-        mock_run2.start_time = None
-        mock_run2.end_time = None
-        mock_run2.extra = {}
-        mock_client.list_runs.return_value = [mock_run1, mock_run2]
+        mock_client.list_runs.return_value = [
+            FakeRun("trace-id-1"),
+            FakeRun("trace-id-2"),
+        ]
         mock_client_class.return_value = mock_client
 
         # Mock the REST API calls for fetch_trace
-        responses.add(
-            responses.GET,
-            "https://api.smith.langchain.com/runs/trace-id-1",
-            json=sample_trace_response,
-            status=200,
-        )
-        responses.add(
-            responses.GET,
-            "https://api.smith.langchain.com/runs/trace-id-2",
-            json=sample_trace_response,
-            status=200,
-        )
+        for trace_id in ("trace-id-1", "trace-id-2"):
+            mock_http.add(
+                "GET",
+                f"{TEST_BASE_URL}/runs/{trace_id}",
+                body=sample_trace_response_body,
+            )
 
         traces_data = fetchers.fetch_recent_traces(
             api_key=TEST_API_KEY, base_url=TEST_BASE_URL, limit=2,
@@ -402,8 +311,7 @@ class TestFetchRecentTraces:
         # Verify list_runs was called with correct parameters
         mock_client.list_runs.assert_called_once()
         call_kwargs = mock_client.list_runs.call_args[1]
-        assert call_kwargs["filter"] == 'and(eq(is_root, true), neq(status, "pending"))'
-        assert call_kwargs["limit"] == 2
+        _assert_list_runs(call_kwargs, limit=2)
 
         # Verify the traces were fetched correctly
         assert isinstance(traces_data, list)
@@ -424,361 +332,151 @@ class TestFetchRecentTraces:
         with pytest.raises(ValueError, match="No traces found matching criteria"):
             fetchers.fetch_recent_traces(api_key=TEST_API_KEY, base_url=TEST_BASE_URL)
 
-    @responses.activate
+    @pytest.mark.parametrize(
+        "kwargs, check_call",
+        [
+            (
+                {"project_uuid": TEST_PROJECT_UUID},
+                lambda ck: ck["project_id"] == TEST_PROJECT_UUID,
+            ),
+            ({"last_n_minutes": 30}, lambda ck: isinstance(ck["start_time"], datetime)),
+            (
+                {"since": "2025-12-09T10:00:00Z"},
+                lambda ck: isinstance(ck["start_time"], datetime),
+            ),
+        ],
+        ids=["project_uuid", "time_window", "since"],
+    )
     @patch("langsmith.Client")
-    def test_fetch_recent_traces_with_project_uuid(
-        self, mock_client_class, sample_trace_response
+    def test_fetch_recent_traces_filters(
+        self,
+        mock_client_class,
+        kwargs,
+        check_call,
+        mock_http,
+        sample_trace_response_body,
     ):
-        """Test recent traces fetching with project UUID filter."""
+        """Test recent traces fetching passes each filter through to list_runs."""
         # Mock the Client
         mock_client = Mock()
-        mock_run = Mock()
-        mock_run.id = TEST_TRACE_ID
-        mock_run.feedback_stats = {}
-        mock_run.start_time = None
-        mock_run.end_time = None
-        mock_run.extra = {}
-        mock_client.list_runs.return_value = [mock_run]
+        mock_client.list_runs.return_value = [FakeRun(TEST_TRACE_ID)]
         mock_client_class.return_value = mock_client
 
         # Mock the REST API call
-        responses.add(
-            responses.GET,
-            f"https://api.smith.langchain.com/runs/{TEST_TRACE_ID}",
-            json=sample_trace_response,
-            status=200,
-        )
+        mock_http.add("GET", TRACE_URL, body=sample_trace_response_body)
 
         traces_data = fetchers.fetch_recent_traces(
             api_key=TEST_API_KEY,
             base_url=TEST_BASE_URL,
             limit=1,
-            project_uuid=TEST_PROJECT_UUID,
             include_metadata=False,
             include_feedback=False,
+            **kwargs,
         )
 
-        # Verify list_runs was called with project_id
+        # Verify list_runs was called with the filter
         call_kwargs = mock_client.list_runs.call_args[1]
-        assert call_kwargs["project_id"] == TEST_PROJECT_UUID
-        assert call_kwargs["filter"] == 'and(eq(is_root, true), neq(status, "pending"))'
-        assert call_kwargs["limit"] == 1
+        _assert_list_runs(call_kwargs, limit=1)
+        assert check_call(call_kwargs)
 
         assert isinstance(traces_data, list)
         assert len(traces_data) == 1
 
-    @responses.activate
-    @patch("langsmith.Client")
-    def test_fetch_recent_traces_with_time_window(
-        self, mock_client_class, sample_trace_response
-    ):
-        """Test recent traces fetching with last_n_minutes filter."""
-        # Mock the Client
-        mock_client = Mock()
-        mock_run = Mock()
-        mock_run.id = TEST_TRACE_ID
-        mock_run.feedback_stats = {}
-        mock_run.start_time = None
-        mock_run.end_time = None
-        mock_run.extra = {}
-        mock_client.list_runs.return_value = [mock_run]
-        mock_client_class.return_value = mock_client
-
-        # Mock the REST API call
-        responses.add(
-            responses.GET,
-            f"https://api.smith.langchain.com/runs/{TEST_TRACE_ID}",
-            json=sample_trace_response,
-            status=200,
-        )
-
-        traces_data = fetchers.fetch_recent_traces(
-            api_key=TEST_API_KEY, base_url=TEST_BASE_URL, last_n_minutes=30,
-            include_metadata=False, include_feedback=False
-        )
-
-        # Verify list_runs was called with start_time
-        call_kwargs = mock_client.list_runs.call_args[1]
-        assert "start_time" in call_kwargs
-        assert isinstance(call_kwargs["start_time"], datetime)
-        assert call_kwargs["filter"] == 'and(eq(is_root, true), neq(status, "pending"))'
-
-        assert isinstance(traces_data, list)
-
-    @responses.activate
-    @patch("langsmith.Client")
-    def test_fetch_recent_traces_with_since_timestamp(
-        self, mock_client_class, sample_trace_response
-    ):
-        """Test recent traces fetching with since timestamp filter."""
-        # Mock the Client
-        mock_client = Mock()
-        mock_run = Mock()
-        mock_run.id = TEST_TRACE_ID
-        mock_run.feedback_stats = {}
-        mock_run.start_time = None
-        mock_run.end_time = None
-        mock_run.extra = {}
-        mock_client.list_runs.return_value = [mock_run]
-        mock_client_class.return_value = mock_client
-
-        # Mock the REST API call
-        responses.add(
-            responses.GET,
-            f"https://api.smith.langchain.com/runs/{TEST_TRACE_ID}",
-            json=sample_trace_response,
-            status=200,
-        )
-
-        since_timestamp = "2025-12-09T10:00:00Z"
-        traces_data = fetchers.fetch_recent_traces(
-            api_key=TEST_API_KEY, base_url=TEST_BASE_URL, since=since_timestamp,
-            include_metadata=False, include_feedback=False
-        )
-
-        # Verify list_runs was called with start_time
-        call_kwargs = mock_client.list_runs.call_args[1]
-        assert "start_time" in call_kwargs
-        assert isinstance(call_kwargs["start_time"], datetime)
-        assert call_kwargs["filter"] == 'and(eq(is_root, true), neq(status, "pending"))'
-
-        assert isinstance(traces_data, list)
-
 
 class TestFetchRecentThreads:
     """Tests for fetch_recent_threads function."""
 
-    @responses.activate
-    def test_fetch_recent_threads_success(self, sample_thread_response):
+    def test_fetch_recent_threads_success(self, mock_http, sample_thread_response_body):
         """Test successful recent threads fetching."""
         # Mock runs query
-        responses.add(
-            responses.POST,
-            f"{TEST_BASE_URL}/runs/query",
-            json={
-                "runs": [
-                    {
-                        "id": "run-1",
-                        "start_time": "2024-01-02T00:00:00Z",
-                        "extra": {"metadata": {"thread_id": "thread-1"}},
-                    },
-                    {
-                        "id": "run-2",
-                        "start_time": "2024-01-01T00:00:00Z",
-                        "extra": {"metadata": {"thread_id": "thread-2"}},
-                    },
-                ]
-            },
-            status=200,
-        )
+        mock_http.add("POST", QUERY_URL, body=TWO_THREADS_QUERY_BODY)
 
         # Mock thread fetches
-        responses.add(
-            responses.GET,
-            f"{TEST_BASE_URL}/runs/threads/thread-1",
-            json=sample_thread_response,
-            status=200,
-        )
-        responses.add(
-            responses.GET,
-            f"{TEST_BASE_URL}/runs/threads/thread-2",
-            json=sample_thread_response,
-            status=200,
-        )
+        mock_http.add("GET", THREAD_URLS[0], body=sample_thread_response_body)
+        mock_http.add("GET", THREAD_URLS[1], body=sample_thread_response_body)
 
         results = fetchers.fetch_recent_threads(
             TEST_PROJECT_UUID, TEST_BASE_URL, TEST_API_KEY, limit=10
         )
 
         assert isinstance(results, list)
-        assert len(results) == 2
-        assert results[0][0] == "thread-1"
-        assert results[1][0] == "thread-2"
-        assert len(results[0][1]) == 3  # 3 messages per thread
-        assert len(results[1][1]) == 3
-
-    @responses.activate
-    def test_fetch_recent_threads_respects_limit(self, sample_thread_response):
+        # Newest thread first, 3 messages per thread
+        assert [(tid, len(msgs)) for tid, msgs in results] == [
+            ("thread-1", 3),
+            ("thread-2", 3),
+        ]
+
+    def test_fetch_recent_threads_respects_limit(
+        self, mock_http, sample_thread_response_body
+    ):
         """Test that fetch_recent_threads respects the limit parameter."""
         # Mock runs query with 3 threads
-        responses.add(
-            responses.POST,
-            f"{TEST_BASE_URL}/runs/query",
-            json={
-                "runs": [
-                    {
-                        "id": "run-1",
-                        "start_time": "2024-01-03T00:00:00Z",
-                        "extra": {"metadata": {"thread_id": "thread-1"}},
-                    },
-                    {
-                        "id": "run-2",
-                        "start_time": "2024-01-02T00:00:00Z",
-                        "extra": {"metadata": {"thread_id": "thread-2"}},
-                    },
-                    {
-                        "id": "run-3",
-                        "start_time": "2024-01-01T00:00:00Z",
-                        "extra": {"metadata": {"thread_id": "thread-3"}},
-                    },
-                ]
-            },
-            status=200,
-        )
+        mock_http.add("POST", QUERY_URL, body=THREE_THREADS_QUERY_BODY)
 
         # Mock only 2 thread fetches (because limit=2)
-        for i in [1, 2]:
-            responses.add(
-                responses.GET,
-                f"{TEST_BASE_URL}/runs/threads/thread-{i}",
-                json=sample_thread_response,
-                status=200,
-            )
+        for url in THREAD_URLS[:2]:
+            mock_http.add("GET", url, body=sample_thread_response_body)
 
         results = fetchers.fetch_recent_threads(
             TEST_PROJECT_UUID, TEST_BASE_URL, TEST_API_KEY, limit=2
         )
 
-        assert len(results) == 2
-        assert results[0][0] == "thread-1"
-        assert results[1][0] == "thread-2"
+        assert [tid for tid, _ in results] == ["thread-1", "thread-2"]
 
-    @responses.activate
     def test_fetch_recent_threads_handles_missing_thread_id(
-        self, sample_thread_response
+        self, mock_http, sample_thread_response_body
     ):
         """Test that runs without thread_id are skipped."""
-        responses.add(
-            responses.POST,
-            f"{TEST_BASE_URL}/runs/query",
-            json={
-                "runs": [
-                    {
-                        "id": "run-1",
-                        "start_time": "2024-01-02T00:00:00Z",
-                        "extra": {"metadata": {"thread_id": "thread-1"}},
-                    },
-                    {
-                        "id": "run-2",
-                        "start_time": "2024-01-01T00:00:00Z",
-                        "extra": {"metadata": {}},  # No thread_id
-                    },
-                ]
-            },
-            status=200,
-        )
+        mock_http.add("POST", QUERY_URL, body=MISSING_THREAD_ID_QUERY_BODY)
 
-        responses.add(
-            responses.GET,
-            f"{TEST_BASE_URL}/runs/threads/thread-1",
-            json=sample_thread_response,
-            status=200,
-        )
+        mock_http.add("GET", THREAD_URLS[0], body=sample_thread_response_body)
 
         results = fetchers.fetch_recent_threads(
             TEST_PROJECT_UUID, TEST_BASE_URL, TEST_API_KEY, limit=10
         )
 
-        assert len(results) == 1
-        assert results[0][0] == "thread-1"
+        assert [tid for tid, _ in results] == ["thread-1"]
 
-    @responses.activate
-    def test_fetch_recent_threads_deduplicates(self, sample_thread_response):
+    def test_fetch_recent_threads_deduplicates(
+        self, mock_http, sample_thread_response_body
+    ):
         """Test that duplicate thread_ids are deduplicated."""
-        responses.add(
-            responses.POST,
-            f"{TEST_BASE_URL}/runs/query",
-            json={
-                "runs": [
-                    {
-                        "id": "run-1",
-                        "start_time": "2024-01-02T00:00:00Z",
-                        "extra": {"metadata": {"thread_id": "thread-1"}},
-                    },
-                    {
-                        "id": "run-2",
-                        "start_time": "2024-01-01T00:00:00Z",
-                        "extra": {"metadata": {"thread_id": "thread-1"}},  # Duplicate
-                    },
-                ]
-            },
-            status=200,
-        )
+        mock_http.add("POST", QUERY_URL, body=DUPLICATE_THREAD_QUERY_BODY)
 
-        responses.add(
-            responses.GET,
-            f"{TEST_BASE_URL}/runs/threads/thread-1",
-            json=sample_thread_response,
-            status=200,
-        )
+        mock_http.add("GET", THREAD_URLS[0], body=sample_thread_response_body)
 
         results = fetchers.fetch_recent_threads(
             TEST_PROJECT_UUID, TEST_BASE_URL, TEST_API_KEY, limit=10
         )
 
         # Should only have one result even though thread-1 appeared twice
-        assert len(results) == 1
-        assert results[0][0] == "thread-1"
+        assert [tid for tid, _ in results] == ["thread-1"]
 
-    @responses.activate
-    def test_fetch_recent_threads_with_last_n_minutes(self, sample_thread_response):
+    def test_fetch_recent_threads_with_last_n_minutes(
+        self, mock_http, sample_thread_response_body
+    ):
         """Test that temporal filter last_n_minutes is passed to API."""
-        responses.add(
-            responses.POST,
-            f"{TEST_BASE_URL}/runs/query",
-            json={
-                "runs": [
-                    {
-                        "id": "run-1",
-                        "start_time": "2024-01-02T00:00:00Z",
-                        "extra": {"metadata": {"thread_id": "thread-1"}},
-                    }
-                ]
-            },
-            status=200,
-        )
+        mock_http.add("POST", QUERY_URL, body=ONE_THREAD_QUERY_BODY)
 
-        responses.add(
-            responses.GET,
-            f"{TEST_BASE_URL}/runs/threads/thread-1",
-            json=sample_thread_response,
-            status=200,
-        )
+        mock_http.add("GET", THREAD_URLS[0], body=sample_thread_response_body)
 
         results = fetchers.fetch_recent_threads(
             TEST_PROJECT_UUID, TEST_BASE_URL, TEST_API_KEY, limit=10, last_n_minutes=30
         )
 
         # Verify the request was made with start_time in body
-        assert len(responses.calls) == 2
-        request_body = json.loads(responses.calls[0].request.body)
+        assert len(mock_http.calls) == 2
+        request_body = json.loads(mock_http.calls[0].body)
         assert "start_time" in request_body
         assert len(results) == 1
 
-    @responses.activate
-    def test_fetch_recent_threads_with_since(self, sample_thread_response):
+    def test_fetch_recent_threads_with_since(
+        self, mock_http, sample_thread_response_body
+    ):
         """Test that temporal filter since is passed to API."""
-        responses.add(
-            responses.POST,
-            f"{TEST_BASE_URL}/runs/query",
-            json={
-                "runs": [
-                    {
-                        "id": "run-1",
-                        "start_time": "2024-01-02T00:00:00Z",
-                        "extra": {"metadata": {"thread_id": "thread-1"}},
-                    }
-                ]
-            },
-            status=200,
-        )
+        mock_http.add("POST", QUERY_URL, body=ONE_THREAD_QUERY_BODY)
 
-        responses.add(
-            responses.GET,
-            f"{TEST_BASE_URL}/runs/threads/thread-1",
-            json=sample_thread_response,
-            status=200,
-        )
+        mock_http.add("GET", THREAD_URLS[0], body=sample_thread_response_body)
 
         results = fetchers.fetch_recent_threads(
             TEST_PROJECT_UUID,
@@ -789,7 +487,7 @@ class TestFetchRecentThreads:
         )
 
         # Verify the request was made with start_time in body
-        assert len(responses.calls) == 2
-        request_body = json.loads(responses.calls[0].request.body)
+        assert len(mock_http.calls) == 2
+        request_body = json.loads(mock_http.calls[0].body)
         assert "start_time" in request_body
         assert len(results) == 1